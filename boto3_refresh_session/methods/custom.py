@@ -16,11 +16,9 @@ from ..utils import (
     Identity,
     Registry,
     TemporaryCredentials,
-    refreshable_session,
 )
 
 
-@refreshable_session
 class CustomRefreshableSession(
     Registry, CredentialProvider, BRSSession, registry_key="custom"
 ):
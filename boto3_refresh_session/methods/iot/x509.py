@@ -47,13 +47,11 @@ from ...utils import (
     Registry,
     TemporaryCredentials,
     Transport,
-    refreshable_session,
 )
 
 _TEMP_PATHS: list[str] = []
 
 
-@refreshable_session
 class IOTX509RefreshableSession(
     Registry,
     BRSSession,
@@ -7,11 +7,20 @@
 __all__ = ["STSRefreshableSession"]
 
 import collections.abc as abc
+import json
 import os
 import re
 import shlex
 import subprocess
-from typing import Any, Callable, Dict, List
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from hashlib import sha1
+from operator import itemgetter
+from pathlib import Path
+from time import sleep
+from typing import Any, Callable, Dict, Iterator, List
+
+from botocore.credentials import RefreshableCredentials
 
 from ..exceptions import BRSConfigurationError, BRSValidationError, BRSWarning
 from ..utils import (
@@ -23,11 +32,109 @@ from ..utils import (
     Registry,
     STSClientConfig,
     TemporaryCredentials,
-    refreshable_session,
 )
 
+# STS always returns these keys in 'Credentials', so a single C-level
+# itemgetter unpack is used on each refresh instead of four dict.get calls
+_extract_credentials = itemgetter(
+    "AccessKeyId", "SecretAccessKey", "SessionToken", "Expiration"
+)
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+# lock and credential cache files shared by processes using use_process_lock;
+# each cache key gets its own brs-refresh-<key>.lock and brs-refresh-<key>.json
+_PROCESS_LOCK_DIR = Path("~/.aws")
+_PROCESS_CACHE_PREFIX = "brs-refresh-"
+
+# seconds between attempts to take a lock held by another process on Windows
+_PROCESS_LOCK_POLL_INTERVAL = 0.1
+
+
+def _try_lock(fd: int) -> bool:
+    """Attempts to take an exclusive lock on ``fd`` without blocking."""
+
+    try:
+        if os.name == "nt":
+            # msvcrt locks bytes from the current position, so pin it to 0
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
+
+
+@contextmanager
+def _process_lock(path: Path, blocking: bool = True) -> Iterator[bool]:
+    """Holds an exclusive OS-level lock on ``path`` for the duration of the
+    context, blocking until the lock is available.
+
+    If ``blocking`` is ``False`` then the lock is only attempted once and the
+    context yields whether it was acquired.
+    """
+
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        if not blocking:
+            acquired = _try_lock(fd)
+        elif os.name == "nt":
+            # LK_LOCK gives up with OSError after ~10 seconds, which a slow
+            # STS call or MFA prompt in another process can exceed, so poll
+            # the non-blocking variant until the lock is free instead
+            while not _try_lock(fd):
+                sleep(_PROCESS_LOCK_POLL_INTERVAL)
+            acquired = True
+        else:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            acquired = True
+        if not acquired:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            if os.name == "nt":
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def _remove_expired_cache_files(directory: Path, keep: Path) -> None:
+    """Deletes credential cache files in ``directory`` that have expired.
+
+    Each file is checked and removed while holding its key's lock, taken
+    without blocking, so an entry another process is refreshing is never
+    deleted after being rewritten; busy keys are skipped until a later
+    sweep. Files that cannot be read or parsed are left alone. Lock files are
+    never deleted: unlinking a lock file another process is waiting on would
+    let two processes lock different files for the same key.
+    """
+
+    now = datetime.now(timezone.utc)
+    for path in directory.glob(f"{_PROCESS_CACHE_PREFIX}*.json"):
+        if path == keep:
+            continue
+        try:
+            with _process_lock(
+                path.with_suffix(".lock"), blocking=False
+            ) as acquired:
+                if not acquired:
+                    continue
+                cached = json.loads(path.read_text(encoding="utf-8"))
+                if datetime.fromisoformat(cached["expiry_time"]) <= now:
+                    path.unlink(missing_ok=True)
+        except (OSError, ValueError, KeyError, TypeError):
+            continue
+
 
-@refreshable_session
 class STSRefreshableSession(
     Registry, CredentialProvider, BRSSession, registry_key="sts"
 ):
@@ -73,6 +180,25 @@ class STSRefreshableSession(
         security reasons when ``mfa_token_provider`` is a command string or
         list of command arguments forwarded to :py:func:`subprocess.run`.
         Default is None.
+    use_process_lock : bool = False, optional
+        If ``True`` then credential refreshes are serialized across processes
+        with an OS-level file lock in ``~/.aws``, and the temporary
+        credentials are shared between those processes through a small JSON
+        cache file (created with owner-only permissions on POSIX systems; on
+        Windows it inherits the ACLs of ``~/.aws``). The cache is keyed on
+        ``assume_role_kwargs`` together with the caller's identity: the
+        source access key ID, profile, and the STS client's region and
+        endpoint. Concurrent processes assuming the same role as the same
+        caller therefore call STS (and any MFA token provider) once per
+        refresh instead of once each, while sessions with different source
+        credentials never share credentials. Source credentials are still
+        resolved by every session when it is created, so a
+        ``credential_process`` configured for the source profile runs once
+        per session regardless of this setting. Each
+        cache key uses its own lock file, so unrelated roles do not wait on
+        each other. Expired cache files are removed whenever the cache is
+        rewritten; the small, empty lock files are left in place. Default
+        is ``False``.
     defer_refresh : bool = True, optional
         If ``True`` then temporary credentials are not automatically refreshed
         until they are explicitly needed. If ``False`` then temporary
@@ -184,6 +310,7 @@ class STSRefreshableSession(
         sts_client_kwargs: STSClientConfig | Dict[str, Any] | None = None,
         mfa_token_provider: Callable[..., str] | List[str] | str | None = None,
         mfa_token_provider_kwargs: Dict[str, Any] | None = None,
+        use_process_lock: bool = False,
         **kwargs,
     ) -> None:
         # initializing asssume_role_kwargs attribute
@@ -247,6 +374,10 @@ class STSRefreshableSession(
         # storing mfa_token_provider_kwargs
         self.mfa_token_provider_kwargs = mfa_token_provider_kwargs or {}
 
+        # storing use_process_lock
+        self.use_process_lock = use_process_lock
+        self._process_lock_caller: Dict[str, Any] | None = None
+
         # ensure SerialNumber is set appropriately with mfa_token_provider
         if (
             self.mfa_token_provider
@@ -303,37 +434,126 @@ class STSRefreshableSession(
         # initializing STS client attribute
         self._sts_client = self.client(**self.sts_client_kwargs)
 
+        # identifying the caller for the shared credential cache; this runs
+        # before __post_init__, so get_credentials still returns the source
+        # credentials rather than the refreshable ones
+        if self.use_process_lock:
+            access_key_id = self.sts_client_kwargs.get("aws_access_key_id")
+            if access_key_id is None:
+                source_credentials = self.get_credentials()
+                if source_credentials is not None:
+                    access_key_id = (
+                        source_credentials.get_frozen_credentials().access_key
+                    )
+            self._process_lock_caller = {
+                "access_key_id": access_key_id,
+                "profile": self.profile_name,
+                "region_name": self._sts_client.meta.region_name,
+                "endpoint_url": self._sts_client.meta.endpoint_url,
+            }
+
     def _get_credentials(self) -> TemporaryCredentials:
+        if self.use_process_lock:
+            return self._get_credentials_with_process_lock()
+        return self._assume_role()
+
+    def _assume_role(self) -> TemporaryCredentials:
+        # binding instance attributes to locals once per refresh
+        assume_role_kwargs = self.assume_role_kwargs
+        mfa_token_provider = self.mfa_token_provider
+        mfa_token_provider_kwargs = self.mfa_token_provider_kwargs
+
         # override TokenCode with fresh token from provider if configured
-        match self.mfa_token_provider:
+        match mfa_token_provider:
             # custom token callable provided
-            case abc.Callable() if self.mfa_token_provider is not None:
-                self.assume_role_kwargs.TokenCode = self.mfa_token_provider(
-                    **self.mfa_token_provider_kwargs
+            case abc.Callable():
+                assume_role_kwargs.TokenCode = mfa_token_provider(
+                    **mfa_token_provider_kwargs
                 )
             # CLI command (str) provided
-            case str() | list() if self.mfa_token_provider is not None:
-                self.assume_role_kwargs.TokenCode = (
-                    self._mfa_token_from_command(
-                        self.mfa_token_provider,
-                        **self.mfa_token_provider_kwargs,
-                    )
+            case str() | list():
+                assume_role_kwargs.TokenCode = self._mfa_token_from_command(
+                    mfa_token_provider, **mfa_token_provider_kwargs
                 )
             # no MFA token provider given (type already validated in __init__)
             case _:
                 ...
 
-        temporary_credentials = self._sts_client.assume_role(
-            **self.assume_role_kwargs
-        )["Credentials"]
+        access_key, secret_key, token, expiration = _extract_credentials(
+            self._sts_client.assume_role(**assume_role_kwargs)["Credentials"]
+        )
 
         return {
-            "access_key": temporary_credentials.get("AccessKeyId"),
-            "secret_key": temporary_credentials.get("SecretAccessKey"),
-            "token": temporary_credentials.get("SessionToken"),
-            "expiry_time": temporary_credentials.get("Expiration").isoformat(),
+            "access_key": access_key,
+            "secret_key": secret_key,
+            "token": token,
+            "expiry_time": expiration.isoformat(),
         }
 
+    def _get_credentials_with_process_lock(self) -> TemporaryCredentials:
+        """Private method which assumes the role while holding a file lock
+        shared with other processes, reusing credentials another process
+        already wrote to the cache file if they are still fresh.
+
+        Cached credentials are considered stale once they are within the
+        botocore refresh window, otherwise botocore would immediately refresh
+        them again.
+        """
+
+        directory = _PROCESS_LOCK_DIR.expanduser()
+        directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+        # TokenCode changes on every refresh and does not affect the role
+        # session, so it is excluded from the cache key; the caller identity
+        # is included so sessions with different source credentials or STS
+        # endpoints never read each other's credentials
+        cache_key = sha1(
+            json.dumps(
+                {
+                    "assume_role_kwargs": {
+                        key: value
+                        for key, value in self.assume_role_kwargs.items()
+                        if key != "TokenCode"
+                    },
+                    "caller": self._process_lock_caller,
+                },
+                sort_keys=True,
+                default=str,
+            ).encode("utf-8")
+        ).hexdigest()
+        cache_path = directory / f"{_PROCESS_CACHE_PREFIX}{cache_key}.json"
+        min_ttl = timedelta(
+            seconds=max(
+                self.advisory_timeout or 0,
+                self.mandatory_timeout or 0,
+                RefreshableCredentials._advisory_refresh_timeout,
+            )
+        )
+
+        with _process_lock(
+            directory / f"{_PROCESS_CACHE_PREFIX}{cache_key}.lock"
+        ):
+            try:
+                cached: TemporaryCredentials = json.loads(
+                    cache_path.read_text(encoding="utf-8")
+                )
+                expiry_time = datetime.fromisoformat(cached["expiry_time"])
+                if expiry_time - datetime.now(timezone.utc) > min_ttl:
+                    return cached
+            except (OSError, ValueError, KeyError, TypeError):
+                # missing or unreadable cache files are simply refreshed
+                ...
+
+            credentials = self._assume_role()
+            fd = os.open(
+                cache_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(credentials, file)
+
+        _remove_expired_cache_files(directory, keep=cache_path)
+        return credentials
+
     def get_identity(self) -> Identity:
         """Returns metadata about the identity assumed.
 
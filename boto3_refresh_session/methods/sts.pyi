@@ -24,6 +24,7 @@ class STSRefreshableSession(Session):
         sts_client_kwargs: STSClientConfig | Dict[str, Any] | None = None,
         mfa_token_provider: Callable[..., str] | List[str] | str | None = None,
         mfa_token_provider_kwargs: Dict[str, Any] | None = None,
+        use_process_lock: bool = False,
         defer_refresh: bool = True,
         advisory_timeout: int = 900,
         mandatory_timeout: int = 600,
@@ -201,7 +201,7 @@ class RefreshableSession:
                 value=method,
             ) from None
 
-        return Registry.registry[method](**kwargs)
+        return Registry.lookup(method)(**kwargs)
 
     @classmethod
     def get_available_methods(cls) -> List[str]:
@@ -29,6 +29,7 @@ class RefreshableSession:
             Callable[..., str] | List[str] | str | None
         ) = None,
         mfa_token_provider_kwargs: Dict[str, Any] | None = None,
+        use_process_lock: bool = False,
         defer_refresh: bool = True,
         advisory_timeout: int = 900,
         mandatory_timeout: int = 600,
@@ -16,9 +16,8 @@ For additional information on AWS specifications, refer to the
 
 __all__ = ["AssumeRoleConfig", "STSClientConfig"]
 
-import re
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Callable, ClassVar, Dict, FrozenSet, List
 
 from botocore.config import Config
 
@@ -33,11 +32,32 @@ from .typing import PolicyDescriptorType, ProvidedContext, Tag
 class BaseConfig(dict, ABC):
     """Base configuration class."""
 
+    # values live in the dict itself; no per-instance __dict__ needed
+    __slots__ = ()
+
+    #: Parameter names accepted by the configuration.
+    _VALID_KEYS: ClassVar[FrozenSet[str]] = frozenset()
+
+    #: Keys passed to ``__setitem__`` at construction even when ``None``.
+    _NONE_SENSITIVE_KEYS: ClassVar[FrozenSet[str]] = frozenset()
+
+    #: Per-key value normalizers applied before validation.
+    _SETTERS: ClassVar[Dict[str, Callable[[Any], Any]]] = {}
+
     def __init__(self, **kwargs):
         super().__init__()
-        self.update(kwargs)
+
+        # None would only delete a key that a fresh config cannot hold yet,
+        # so skip it unless the key validates or defaults on None
+        none_sensitive = self._NONE_SENSITIVE_KEYS
+        for key, value in kwargs.items():
+            if value is not None or key in none_sensitive:
+                self.__setitem__(key, value)
 
     def __setitem__(self, key: str, value: Any) -> None:
+        setter = self._SETTERS.get(key)
+        if setter is not None:
+            value = setter(value)
         self._validate(key, value)
         if value is None:
             if key in self:
@@ -46,28 +66,36 @@ class BaseConfig(dict, ABC):
         super().__setitem__(key, value)
 
     def __getattr__(self, name: str) -> Any:
-        try:
-            return self[name]
-        except KeyError:
-            try:
-                self._validate(name, None)
-            except BRSValidationError as exc:
-                raise AttributeError(
-                    f"'{name}' is an unknown attribute."
-                ) from exc
-            return None
+        # valid but unset keys resolve to None via dict.get
+        if name in self._VALID_KEYS:
+            return dict.get(self, name)
+        raise AttributeError(f"'{name}' is an unknown attribute.")
 
     def __setattr__(self, name: str, value: Any) -> None:
         self.__setitem__(name, value)
 
-    def update(self, *args, **kwargs) -> None:
-        for key, value in dict(*args, **kwargs).items():
+    def update(self, other: Any = (), /, **kwargs) -> None:
+        # mirrors dict.update without first copying into a temporary dict
+        if isinstance(other, dict):
+            items = other.items()
+        elif hasattr(other, "keys"):
+            items = ((key, other[key]) for key in other.keys())
+        else:
+            items = other
+        for key, value in items:
+            self.__setitem__(key, value)
+        for key, value in kwargs.items():
             self.__setitem__(key, value)
 
-    def setdefault(self, key: str, default: Any = None) -> None:
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        # present values were validated when they were set
         if key in self:
-            return super().setdefault(key, default)
+            return dict.__getitem__(self, key)
         self._validate(key, default)
+
+        # None means "unset", so it is never stored
+        if default is None:
+            return None
         return super().setdefault(key, default)
 
     @abstractmethod
@@ -122,6 +150,11 @@ class AssumeRoleConfig(BaseConfig):
     `API Reference for AssumeRole <https://docs.aws.amazon.com/STS/latest/APIReference/API_AssumeRole.html>`_.
     """
 
+    __slots__ = ()
+
+    _VALID_KEYS = ASSUME_ROLE_CONFIG_PARAMETERS
+    _NONE_SENSITIVE_KEYS = frozenset({"RoleArn"})
+
     def __init__(
         self,
         *,  # enforce keyword-only arguments
@@ -154,11 +187,9 @@ class AssumeRoleConfig(BaseConfig):
         )
 
     def _validate(self, key: str, value: Any) -> None:
-        # superfluous but why not
-        if not isinstance(key, str):
-            raise BRSValidationError("Attribute name must be a string.")
-
         # this is superfluous/pedantic since __init__ only allows valid keys . . .
+        # hashable non-string keys are rejected too, since all parameters are
+        # str; unhashable keys raise TypeError, as they would for any dict
         if key not in ASSUME_ROLE_CONFIG_PARAMETERS:
             raise BRSValidationError(
                 f"'{key}' is not a valid attribute for AssumeRoleConfig."
@@ -179,7 +210,12 @@ class AssumeRoleConfig(BaseConfig):
         if (
             key == "TokenCode"
             and value is not None
-            and not (isinstance(value, str) and re.fullmatch(r"\d{6}", value))
+            and not (
+                isinstance(value, str)
+                and len(value) == 6
+                and value.isascii()
+                and value.isdigit()
+            )
         ):
             raise BRSValidationError(
                 f"'{key}' must be a 6-digit numeric string."
@@ -228,6 +264,11 @@ class STSClientConfig(BaseConfig):
     provided, it will be overridden to 'sts' with a warning.
     """
 
+    __slots__ = ()
+
+    _VALID_KEYS = STS_CLIENT_CONFIG_PARAMETERS
+    _NONE_SENSITIVE_KEYS = frozenset({"service_name"})
+
     def __init__(
         self,
         *,  # enforce keyword-only arguments
@@ -257,34 +298,29 @@ class STSClientConfig(BaseConfig):
             aws_account_id=aws_account_id,
         )
 
-    def __setitem__(self, key: str, value: Any) -> None:
-        """Override to enforce 'sts' as service_name."""
-
-        if key == "service_name":
-            if value is None:
-                value = "sts"
-            elif isinstance(value, str):
-                if value != "sts":
-                    BRSWarning.warn(
-                        "The 'service_name' for STSClientConfig should be "
-                        "'sts'. Overriding to 'sts'."
-                    )
-                    value = "sts"
-            else:
-                raise BRSValidationError(
-                    "'service_name' must be a string."
-                ) from None
+    @staticmethod
+    def _normalize_service_name(value: Any) -> str:
+        """Enforces 'sts' as service_name."""
 
-        super().__setitem__(key, value)
-
-    def _validate(self, key: str, value: Any) -> None:
-        # superfluous but why not
-        if not isinstance(key, str):
+        if value is None:
+            return "sts"
+        if not isinstance(value, str):
             raise BRSValidationError(
-                "Attribute name must be a string."
+                "'service_name' must be a string."
             ) from None
+        if value != "sts":
+            BRSWarning.warn(
+                "The 'service_name' for STSClientConfig should be "
+                "'sts'. Overriding to 'sts'."
+            )
+        return "sts"
 
+    _SETTERS = {"service_name": _normalize_service_name}
+
+    def _validate(self, key: str, value: Any) -> None:
         # superfluous/pedantic since __init__ only allows valid keys but why not
+        # (also rejects hashable non-string keys, since all parameters are str;
+        # unhashable keys raise TypeError, as they would for any dict)
         if key not in STS_CLIENT_CONFIG_PARAMETERS:
             raise BRSValidationError(
                 f"'{key}' is not a valid attribute for STSClientConfig."
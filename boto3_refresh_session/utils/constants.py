@@ -8,21 +8,81 @@ __all__ = [
     "SUBPROCESS_ALLOWED_PARAMETERS",
 ]
 
-import inspect
-import subprocess
-from typing import Set, Tuple
+import sys
+from typing import FrozenSet
 
-from .typing import AssumeRoleParams, STSClientParams
-
-# config parameter names
-ASSUME_ROLE_CONFIG_PARAMETERS: Tuple[str, ...] = tuple(
-    AssumeRoleParams.__annotations__
+# config parameter names; mirror the keys of AssumeRoleParams and
+# STSClientParams in utils/typing.py, kept in sync by tests
+ASSUME_ROLE_CONFIG_PARAMETERS: FrozenSet[str] = frozenset(
+    {
+        "RoleArn",
+        "RoleSessionName",
+        "PolicyArns",
+        "Policy",
+        "DurationSeconds",
+        "ExternalId",
+        "SerialNumber",
+        "TokenCode",
+        "Tags",
+        "TransitiveTagKeys",
+        "SourceIdentity",
+        "ProvidedContexts",
+    }
 )
-STS_CLIENT_CONFIG_PARAMETERS: Tuple[str, ...] = tuple(
-    STSClientParams.__annotations__
+STS_CLIENT_CONFIG_PARAMETERS: FrozenSet[str] = frozenset(
+    {
+        "service_name",
+        "region_name",
+        "api_version",
+        "use_ssl",
+        "verify",
+        "endpoint_url",
+        "aws_access_key_id",
+        "aws_secret_access_key",
+        "aws_session_token",
+        "config",
+        "aws_account_id",
+    }
 )
 
-# subprocess.run parameter names
-SUBPROCESS_ALLOWED_PARAMETERS: Set[str] = set(
-    inspect.signature(subprocess.run).parameters
-) | set(inspect.signature(subprocess.Popen).parameters)
+# subprocess.run parameter names; hardcoded rather than derived with
+# inspect.signature at import time, and kept in sync by tests
+SUBPROCESS_ALLOWED_PARAMETERS: FrozenSet[str] = frozenset(
+    {
+        # subprocess.run
+        "input",
+        "capture_output",
+        "timeout",
+        "check",
+        # subprocess.Popen
+        "args",
+        "bufsize",
+        "executable",
+        "stdin",
+        "stdout",
+        "stderr",
+        "preexec_fn",
+        "close_fds",
+        "shell",
+        "cwd",
+        "env",
+        "universal_newlines",
+        "startupinfo",
+        "creationflags",
+        "restore_signals",
+        "start_new_session",
+        "pass_fds",
+        "user",
+        "group",
+        "extra_groups",
+        "encoding",
+        "errors",
+        "text",
+        "umask",
+        "pipesize",
+    }
+) | (
+    frozenset({"process_group"})
+    if sys.version_info >= (3, 11)
+    else frozenset()
+)
@@ -6,12 +6,19 @@
 
 __all__ = ["IOT_EXTRA_INSTALLED"]
 
-from importlib.util import find_spec
 from typing import TYPE_CHECKING
 
 # checking whether 'iot' extra is installed or we're in a type-checking context
-IOT_EXTRA_INSTALLED: bool = (
-    True
-    if TYPE_CHECKING
-    else find_spec("awscrt") is not None and find_spec("awsiot") is not None
-)
+# importing directly rather than probing with find_spec, since the iot method
+# imports both packages anyway whenever they are present
+IOT_EXTRA_INSTALLED: bool
+if TYPE_CHECKING:
+    IOT_EXTRA_INSTALLED = True
+else:
+    try:
+        import awscrt  # noqa: F401
+        import awsiot  # noqa: F401
+    except ImportError:
+        IOT_EXTRA_INSTALLED = False
+    else:
+        IOT_EXTRA_INSTALLED = True
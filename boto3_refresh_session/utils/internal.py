@@ -16,9 +16,10 @@ implementations.
 `__post_init__` hook runs after `boto3.Session` initialization. This allows
 `BRSSession` to create refreshable credentials only after the boto3 Session is
 set up, avoiding circular and ordering issues. It also prevents double
-wrapping on repeated decoration.
+wrapping on repeated decoration. `BRSSession.__init_subclass__` applies it to
+every subclass automatically, so method classes need not be decorated.
 
-`CredentialProvider` is a small abstract class that defines the contract for
+`CredentialProvider` is a small base class that defines the contract for
 refreshable sessions: implement `_get_credentials` (returns temporary creds)
 and `get_identity` (describes the caller identity). The concrete refresh
 methods (STS, IoT, custom) only need to satisfy this interface.
@@ -40,7 +41,6 @@ __all__ = [
     "refreshable_session",
 ]
 
-from abc import ABC, abstractmethod
 from functools import wraps
 from typing import Any, ClassVar, Generic, TypeVar
 
@@ -49,6 +49,7 @@ from boto3_client_cache import (
 )
 from botocore.credentials import (
     DeferredRefreshableCredentials,
+    ReadOnlyCredentials,
     RefreshableCredentials,
 )
 
@@ -64,14 +65,32 @@ if IOT_EXTRA_INSTALLED:
     __all__ += ["AWSCRTResponse"]
 
     class AWSCRTResponse:
-        """Lightweight response collector for awscrt HTTP."""
+        """Lightweight response collector for awscrt HTTP.
+
+        When the response declares a ``Content-Length``, the body buffer is
+        allocated once at that size and chunks are written into it in place.
+        """
+
+        __slots__ = ("status_code", "headers", "_body", "_view", "_size")
+
+        #: Upper bound on how much body is preallocated from Content-Length.
+        _MAX_PREALLOCATED_BODY = 1 << 20
 
         def __init__(self) -> None:
             """Initialize to default for when callbacks are called."""
 
             self.status_code = None
             self.headers = None
-            self.body = bytearray()
+            self._body = bytearray()
+            self._view: memoryview | None = None
+            self._size = 0
+
+        @property
+        def body(self) -> bytearray:
+            """The response body received so far."""
+
+            self._release_view()
+            return self._body
 
         def on_response(
             self, http_stream, status_code, headers, **kwargs
@@ -81,24 +100,63 @@ if IOT_EXTRA_INSTALLED:
             self.status_code = status_code
             self.headers = HttpHeaders(headers)
 
+            # preallocating the body buffer if its size is known up front
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+            except ValueError:
+                return
+            if 0 < length <= self._MAX_PREALLOCATED_BODY and not self._body:
+                self._body = bytearray(length)
+                self._view = memoryview(self._body)
+                self._size = 0
+
         def on_body(self, http_stream, chunk, **kwargs) -> None:
             """Process awscrt.io body."""
 
-            self.body.extend(chunk)
+            view = self._view
+            if view is not None:
+                start = self._size
+                end = start + len(chunk)
+                if end <= len(view):
+                    view[start:end] = chunk
+                    self._size = end
+                    return
+
+                # more data than Content-Length promised
+                self._release_view()
 
+            self._body.extend(chunk)
 
-class CredentialProvider(ABC):
-    """Defines the abstract surface every refreshable session must expose."""
+        def _release_view(self) -> None:
+            """Trims the preallocated buffer to the bytes actually written."""
 
-    @abstractmethod
-    def _get_credentials(self) -> TemporaryCredentials: ...
+            if self._view is not None:
+                # the view must be released before the buffer can be resized
+                self._view.release()
+                self._view = None
+                del self._body[self._size :]
 
-    @abstractmethod
-    def get_identity(self) -> Identity: ...
+
+class CredentialProvider:
+    """Defines the surface every refreshable session must expose.
+
+    This is a plain base class rather than an ``ABC`` so that session
+    construction goes through ``type.__call__`` instead of ``ABCMeta``.
+    """
+
+    def _get_credentials(self) -> TemporaryCredentials:
+        raise NotImplementedError
+
+    def get_identity(self) -> Identity:
+        raise NotImplementedError
 
 
 T_Registry = TypeVar("T_Registry", bound="Registry[Any, Any]")
 
+# backing store for Registry.registry; bound at module level so lookups skip
+# the class attribute traversal
+_REGISTRY: dict[str, type[Any]] = {}
+
 
 class Registry(Generic[RegistryKey, T_Registry]):
     """Lightweight class-level registry for mapping ``RefreshableSession``
@@ -110,19 +168,43 @@ class Registry(Generic[RegistryKey, T_Registry]):
         The class-level registry mapping keys to classes.
     """
 
-    registry: ClassVar[dict[str, type[Any]]] = {}
+    registry: ClassVar[dict[str, type[Any]]] = _REGISTRY
 
     def __init_subclass__(
         cls: type[T_Registry], *, registry_key: RegistryKey, **kwargs: Any
     ) -> None:
         super().__init_subclass__(**kwargs)
 
-        if registry_key in cls.registry:
+        # single probe for the common case where the key is new
+        registry = _REGISTRY
+        registered = registry.setdefault(registry_key, cls)
+        if registered is not cls:
             BRSWarning.warn(
                 f"{registry_key!r} already registered. Overwriting."
             )
+            registry[registry_key] = cls
+
+    @classmethod
+    def lookup(cls, registry_key: RegistryKey) -> type[Any]:
+        """Returns the class registered under a key.
 
-        cls.registry[registry_key] = cls
+        Parameters
+        ----------
+        registry_key : RegistryKey
+            The key the class was registered with.
+
+        Returns
+        -------
+        type[Any]
+            The registered class.
+
+        Raises
+        ------
+        KeyError
+            If nothing is registered under ``registry_key``.
+        """
+
+        return _REGISTRY[registry_key]
 
 
 # defining this here instead of utils to avoid circular imports lol
@@ -152,14 +234,25 @@ def refreshable_session(
     if getattr(init, "__post_init_wrapped__", False):
         return cls
 
+    # resolving whether a __post_init__ hook exists once, at decoration time;
+    # without one there is nothing to wrap
+    if not callable(getattr(cls, "__post_init__", None)):
+        return cls
+
     @wraps(init)
     def wrapper(self, *args, **kwargs) -> None:
         init(self, *args, **kwargs)
-        post = getattr(self, "__post_init__", None)
 
-        # calling __post_init__ if it exists
-        if callable(post) and not getattr(self, "_post_inited", False):
-            post()
+        # when a subclass is wrapped too, this runs inside its __init__ (via
+        # super().__init__), so leave the hook to the outermost wrapper; if
+        # the most-derived __init__ is not wrapped, the first wrapper to
+        # finish runs it, with _post_inited guarding against a second call
+        outer = type(self).__init__
+        if (
+            outer is wrapper
+            or not getattr(outer, "__post_init_wrapped__", False)
+        ) and not getattr(self, "_post_inited", False):
+            self.__post_init__()
             self._post_inited = True
 
     # flagging wrapper to avoid double wrapping
@@ -236,9 +329,22 @@ class BRSSession(Session):
         self.advisory_timeout: int | None = advisory_timeout
         self.mandatory_timeout: int | None = mandatory_timeout
 
+        # frozen credentials and the dict built from them; reused by
+        # refreshable_credentials until botocore refreshes the credentials
+        self._credentials_cache: (
+            tuple[ReadOnlyCredentials, TemporaryCredentials] | None
+        ) = None
+
         # initializing Session
         super().__init__(**kwargs)
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        # wrapping __init__ at every level; only the wrapper around the
+        # most-derived __init__ calls __post_init__, after it has finished
+        refreshable_session(cls)
+
     def __post_init__(self) -> None:
         if not self.defer_refresh:
             self._credentials = RefreshableCredentials.create_from_metadata(
@@ -275,6 +381,11 @@ class BRSSession(Session):
                     AWS session token.
                 expiry_time : str
                     Expiration timestamp in ISO 8601 format.
+
+        Notes
+        -----
+        The same dict is returned until the credentials are refreshed, so
+        copy it before mutating it.
         """
 
         creds = (
@@ -283,12 +394,21 @@ class BRSSession(Session):
             else self.get_credentials()
         )
         frozen_creds = creds.get_frozen_credentials()
-        return {
+
+        # botocore only replaces the frozen credentials object on refresh,
+        # so an identity check is enough to know the cached dict is current
+        cached = self._credentials_cache
+        if cached is not None and cached[0] is frozen_creds:
+            return cached[1]
+
+        credentials: TemporaryCredentials = {
             "access_key": frozen_creds.access_key,
             "secret_key": frozen_creds.secret_key,
             "token": frozen_creds.token,
             "expiry_time": creds._expiry_time.isoformat(),  # type: ignore[arg-type]
         }
+        self._credentials_cache = (frozen_creds, credentials)
+        return credentials
 
     @property
     def credentials(self) -> TemporaryCredentials:
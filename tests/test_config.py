@@ -6,6 +6,14 @@ from boto3_refresh_session import (
     BRSWarning,
     STSClientConfig,
 )
+from boto3_refresh_session.utils.constants import (
+    ASSUME_ROLE_CONFIG_PARAMETERS,
+    STS_CLIENT_CONFIG_PARAMETERS,
+)
+from boto3_refresh_session.utils.typing import (
+    AssumeRoleParams,
+    STSClientParams,
+)
 
 
 def test_assume_role_config_behaves_like_dict():
@@ -44,6 +52,9 @@ def test_assume_role_config_validation():
     with pytest.raises(BRSValidationError):
         config["NotAKey"] = "nope"
 
+    with pytest.raises(BRSValidationError):
+        config[1] = "nope"  # type: ignore[index]
+
     with pytest.raises(BRSValidationError):
         config.TokenCode = "bad"
 
@@ -54,6 +65,28 @@ def test_assume_role_config_validation():
 @pytest.mark.parametrize(
     "value",
     [
+        "12345",
+        "1234567",
+        "12345a",
+        " 123456",
+        "\u0661\u0662\u0663\u0664\u0665\u0666",
+        123456,
+    ],
+)
+def test_assume_role_config_token_code_requires_six_ascii_digits(value):
+    """Rejects TokenCode values that are not six ASCII digits."""
+    config = AssumeRoleConfig(
+        RoleArn="arn:aws:iam::123456789012:role/TestRole"
+    )
+
+    with pytest.raises(BRSValidationError):
+        config.TokenCode = value
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
         123,
         12.34,
         {},
@@ -96,6 +129,9 @@ def test_assume_role_config_setdefault_validates():
     with pytest.raises(BRSValidationError):
         config.setdefault("NotAKey", "nope")
 
+    assert config.setdefault("SerialNumber") is None
+    assert "SerialNumber" not in config
+
 
 def test_assume_role_config_setdefault_does_not_overwrite():
     """Preserves existing values when using setdefault."""
@@ -123,6 +159,31 @@ def test_assume_role_config_none_removes_key():
     assert config.ExternalId is None
 
 
+def test_assume_role_config_update_accepts_dict_forms():
+    """Accepts mappings, key/value pairs, and kwargs like dict.update."""
+    config = AssumeRoleConfig(
+        RoleArn="arn:aws:iam::123456789012:role/TestRole",
+        ExternalId="external",
+    )
+
+    config.update({"RoleSessionName": "unit-test"}, ExternalId=None)
+    config.update([("SerialNumber", "serial")])
+    config.update(
+        AssumeRoleConfig(
+            RoleArn="arn:aws:iam::123456789012:role/OtherRole",
+        )
+    )
+
+    assert config == {
+        "RoleArn": "arn:aws:iam::123456789012:role/OtherRole",
+        "RoleSessionName": "unit-test",
+        "SerialNumber": "serial",
+    }
+
+    with pytest.raises(BRSValidationError):
+        config.update(NotAKey="nope")
+
+
 def test_assume_role_config_pop_and_popitem():
     """Supports pop and popitem for mutable config values."""
     config = AssumeRoleConfig(
@@ -142,6 +203,32 @@ def test_assume_role_config_pop_and_popitem():
     assert remaining in {"external", "source"}
 
 
+@pytest.mark.parametrize(
+    "config",
+    [
+        AssumeRoleConfig(RoleArn="arn:aws:iam::123456789012:role/TestRole"),
+        STSClientConfig(),
+    ],
+)
+def test_config_unhashable_keys_raise_type_error(config):
+    """Rejects unhashable keys with TypeError, as a plain dict does."""
+    with pytest.raises(TypeError):
+        config[["RoleArn"]] = "nope"
+
+    with pytest.raises(TypeError):
+        config.setdefault(["RoleArn"], "nope")
+
+
+def test_configs_have_no_instance_dict():
+    """Config instances store values only in the dict itself."""
+    assume_role_config = AssumeRoleConfig(
+        RoleArn="arn:aws:iam::123456789012:role/TestRole",
+    )
+
+    assert not hasattr(assume_role_config, "__dict__")
+    assert not hasattr(STSClientConfig(), "__dict__")
+
+
 def test_sts_client_config_service_name_normalizes():
     """Normalizes service_name to sts and warns on overrides."""
     config = STSClientConfig()
@@ -165,3 +252,13 @@ def test_sts_client_config_dot_notation_returns_none():
 
     assert config.endpoint_url is None
     assert "endpoint_url" not in config
+
+
+def test_config_parameters_match_typed_dicts():
+    """Hardcoded parameter names match the TypedDict definitions."""
+    assert ASSUME_ROLE_CONFIG_PARAMETERS == frozenset(
+        AssumeRoleParams.__annotations__
+    )
+    assert STS_CLIENT_CONFIG_PARAMETERS == frozenset(
+        STSClientParams.__annotations__
+    )
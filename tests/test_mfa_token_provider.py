@@ -1,3 +1,4 @@
+import inspect
 import subprocess
 from typing import cast
 
@@ -10,6 +11,9 @@ from boto3_refresh_session import (
     BRSValidationError,
     STSRefreshableSession,
 )
+from boto3_refresh_session.utils.constants import (
+    SUBPROCESS_ALLOWED_PARAMETERS,
+)
 
 
 def _session():
@@ -177,6 +181,16 @@ def test_mfa_token_from_command_rejects_preexec_fn_kwarg():
         session._mfa_token_from_command("echo 123456", preexec_fn=lambda: None)  # type: ignore
 
 
+def test_subprocess_allowed_parameters_match_signatures():
+    """Hardcoded subprocess parameters match the running interpreter."""
+    parameters = (
+        set(inspect.signature(subprocess.run).parameters)
+        | set(inspect.signature(subprocess.Popen).parameters)
+    ) - {"popenargs", "kwargs"}
+
+    assert SUBPROCESS_ALLOWED_PARAMETERS == parameters
+
+
 def test_token_code_validation_accepts_six_digits():
     """Accepts a strict 6-digit TokenCode value."""
     config = AssumeRoleConfig(
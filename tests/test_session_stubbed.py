@@ -1,3 +1,5 @@
+import json
+import os
 from datetime import datetime, timedelta, timezone
 from threading import Barrier, Lock, Thread
 from time import sleep
@@ -8,21 +10,29 @@ import pytest
 from botocore.config import Config
 from botocore.stub import Stubber
 
+import boto3_refresh_session.methods.sts as sts_module
 from boto3_refresh_session import (
     IOT_EXTRA_INSTALLED,
     AssumeRoleConfig,
     BRSConfigurationError,
     BRSCredentialError,
     BRSValidationError,
+    BRSWarning,
     Method,
     RefreshableSession,
 )
-from boto3_refresh_session.utils import Registry
+from boto3_refresh_session.utils import (
+    BRSSession,
+    Registry,
+    internal,
+    refreshable_session,
+)
 
 if IOT_EXTRA_INSTALLED:
     from boto3_refresh_session.methods.iot.x509 import (
         IOTX509RefreshableSession,
     )
+    from boto3_refresh_session.utils import AWSCRTResponse
 
 skip_iot = pytest.mark.skipif(
     not IOT_EXTRA_INSTALLED, reason="iot extra not installed"
@@ -157,6 +167,102 @@ def test_refreshable_session_positional_assume_role_config_without_method():
         RefreshableSession(config)  # type: ignore[arg-type]
 
 
+def test_refreshable_session_wraps_only_classes_with_post_init():
+    """Leaves hook-less classes alone and runs __post_init__ exactly once."""
+
+    class NoHook:
+        def __init__(self):
+            pass
+
+    init = NoHook.__init__
+    assert refreshable_session(NoHook).__init__ is init  # type: ignore
+
+    @refreshable_session  # type: ignore[type-var]
+    class Parent:
+        def __init__(self):
+            self.calls = 0
+
+        def __post_init__(self):
+            self.calls += 1
+
+    @refreshable_session  # type: ignore[type-var]
+    class Child(Parent):
+        def __init__(self):
+            super().__init__()
+
+    assert Parent().calls == 1
+    assert Child().calls == 1
+
+
+def test_brs_session_subclasses_run_post_init_without_decorator(monkeypatch):
+    """Subclasses of BRSSession get __post_init__ wired automatically."""
+    _set_dummy_env(monkeypatch)
+
+    class Undecorated(BRSSession):
+        def __init__(self, **kwargs):
+            super().__init__(refresh_method="custom", **kwargs)
+            self.ready = True
+
+        def __post_init__(self):
+            assert self.ready
+            super().__post_init__()
+
+        def _get_credentials(self):
+            raise AssertionError("deferred credentials should not load")
+
+    session = Undecorated(region_name="us-east-1")
+    assert session._credentials is not None
+    assert session._session._credentials is session._credentials
+
+
+def test_brs_session_nested_subclasses_run_post_init_once_at_the_end(
+    monkeypatch,
+):
+    """__post_init__ waits for the most-derived __init__ and runs once."""
+    _set_dummy_env(monkeypatch)
+    calls = []
+
+    class Parent(BRSSession):
+        def __init__(self, **kwargs):
+            super().__init__(refresh_method="custom", **kwargs)
+            self.parent_ready = True
+
+        def _get_credentials(self):
+            raise AssertionError("deferred credentials should not load")
+
+    class Child(Parent):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.child_ready = True
+
+        def __post_init__(self):
+            assert self.parent_ready and self.child_ready
+            calls.append(type(self))
+            super().__post_init__()
+
+    session = Child(region_name="us-east-1")
+    assert calls == [Child]
+    assert session._session._credentials is session._credentials
+
+
+def test_registry_warns_when_overwriting_key(monkeypatch):
+    """Warns only when a registry key is registered a second time."""
+    registry: dict = {}
+    monkeypatch.setattr(internal, "_REGISTRY", registry)
+    monkeypatch.setattr(Registry, "registry", registry)
+
+    class First(Registry, registry_key="dummy"):  # type: ignore[type-var]
+        pass
+
+    with pytest.warns(BRSWarning, match="already registered"):
+
+        class Second(Registry, registry_key="dummy"):  # type: ignore[type-var]
+            pass
+
+    assert Registry.registry == {"dummy": Second}
+    assert Registry.lookup("dummy") is Second  # type: ignore[arg-type]
+
+
 def test_registry_tracks_method_and_refresh_method(monkeypatch):
     """Registers available refresh methods and their refresh_method values."""
     _set_dummy_env(monkeypatch)
@@ -306,6 +412,233 @@ def test_sts_refreshable_credentials_with_mfa_stubbed(monkeypatch):
         stubber.deactivate()
 
 
+_PROCESS_LOCK_ROLE = {
+    "RoleArn": "arn:aws:iam::123456789012:role/TestRole",
+    "RoleSessionName": "unit-test",
+}
+
+
+def _process_lock_dir(monkeypatch, tmp_path):
+    """Points the process lock cache at a temporary directory."""
+
+    directory = tmp_path / ".aws"
+    monkeypatch.setattr(sts_module, "_PROCESS_LOCK_DIR", directory)
+    return directory
+
+
+def _add_assume_role_response(stubber, access_key, expires_in):
+    """Stubs one assume_role call returning ``access_key``."""
+
+    stubber.add_response(
+        "assume_role",
+        {
+            "Credentials": {
+                "AccessKeyId": access_key,
+                "SecretAccessKey": "secret",
+                "SessionToken": "token",
+                "Expiration": datetime.now(timezone.utc) + expires_in,
+            },
+        },
+        _PROCESS_LOCK_ROLE,
+    )
+
+
+def _process_lock_session(**kwargs):
+    """Builds an STS session sharing credentials via the process lock."""
+
+    return RefreshableSession(
+        method="sts",
+        assume_role_kwargs=_PROCESS_LOCK_ROLE,
+        use_process_lock=True,
+        region_name="us-east-1",
+        defer_refresh=True,
+        **kwargs,
+    )
+
+
+def test_sts_process_lock_shares_credentials(monkeypatch, tmp_path):
+    """Reuses credentials cached by another session using the process lock."""
+
+    _set_dummy_env(monkeypatch)
+    directory = _process_lock_dir(monkeypatch, tmp_path)
+    stubber = _stubbed_sts_client(monkeypatch)
+    _add_assume_role_response(stubber, "AKIAEXAMPLE123456", timedelta(hours=1))
+    sessions = [_process_lock_session() for _ in range(2)]
+
+    try:
+        # only one assume_role response is stubbed, so the second session
+        # must be served from the shared cache file
+        creds = [session.refreshable_credentials() for session in sessions]
+        assert creds[0] == creds[1]
+        assert creds[1]["access_key"] == "AKIAEXAMPLE123456"
+        stubber.assert_no_pending_responses()
+
+        cache_files = list(directory.glob("brs-refresh-*.json"))
+        assert len(cache_files) == 1
+        assert cache_files[0].with_suffix(".lock").exists()
+        if os.name != "nt":
+            assert cache_files[0].stat().st_mode & 0o777 == 0o600
+    finally:
+        stubber.deactivate()
+
+
+def test_sts_process_lock_refreshes_stale_cache(monkeypatch, tmp_path):
+    """Calls STS again when cached credentials are inside the refresh window."""
+
+    _set_dummy_env(monkeypatch)
+    directory = _process_lock_dir(monkeypatch, tmp_path)
+    stubber = _stubbed_sts_client(monkeypatch)
+
+    # 12 minutes is outside the mandatory window but inside the advisory one
+    _add_assume_role_response(
+        stubber, "KEY0000000000001", timedelta(minutes=12)
+    )
+    _add_assume_role_response(stubber, "KEY0000000000002", timedelta(hours=1))
+
+    try:
+        first = _process_lock_session().refreshable_credentials()
+        second = _process_lock_session().refreshable_credentials()
+        assert first["access_key"] == "KEY0000000000001"
+        assert second["access_key"] == "KEY0000000000002"
+        stubber.assert_no_pending_responses()
+
+        (cache_file,) = directory.glob("brs-refresh-*.json")
+        cached = json.loads(cache_file.read_text(encoding="utf-8"))
+        assert cached["access_key"] == "KEY0000000000002"
+    finally:
+        stubber.deactivate()
+
+
+def test_sts_process_lock_rewrites_corrupt_cache(monkeypatch, tmp_path):
+    """Ignores an unreadable cache file and replaces it after refreshing."""
+
+    _set_dummy_env(monkeypatch)
+    directory = _process_lock_dir(monkeypatch, tmp_path)
+    stubber = _stubbed_sts_client(monkeypatch)
+    _add_assume_role_response(stubber, "KEY0000000000001", timedelta(hours=1))
+    _add_assume_role_response(stubber, "KEY0000000000002", timedelta(hours=1))
+
+    try:
+        _process_lock_session().refreshable_credentials()
+        (cache_file,) = directory.glob("brs-refresh-*.json")
+        cache_file.write_text('{"access_key": "KEY00', encoding="utf-8")
+
+        creds = _process_lock_session().refreshable_credentials()
+        assert creds["access_key"] == "KEY0000000000002"
+        stubber.assert_no_pending_responses()
+
+        cached = json.loads(cache_file.read_text(encoding="utf-8"))
+        assert cached == creds
+    finally:
+        stubber.deactivate()
+
+
+def test_sts_process_lock_separates_callers(monkeypatch, tmp_path):
+    """Sessions with different source credentials never share a cache file."""
+
+    _set_dummy_env(monkeypatch)
+    directory = _process_lock_dir(monkeypatch, tmp_path)
+    stubber = _stubbed_sts_client(monkeypatch)
+    _add_assume_role_response(stubber, "KEY0000000000001", timedelta(hours=1))
+    _add_assume_role_response(stubber, "KEY0000000000002", timedelta(hours=1))
+
+    try:
+        first = _process_lock_session(
+            aws_access_key_id="AKIACALLER0000000001",
+            aws_secret_access_key="secret-one",
+        ).refreshable_credentials()
+        second = _process_lock_session(
+            aws_access_key_id="AKIACALLER0000000002",
+            aws_secret_access_key="secret-two",
+        ).refreshable_credentials()
+
+        assert first["access_key"] == "KEY0000000000001"
+        assert second["access_key"] == "KEY0000000000002"
+        stubber.assert_no_pending_responses()
+        assert len(list(directory.glob("brs-refresh-*.json"))) == 2
+    finally:
+        stubber.deactivate()
+
+
+def test_sts_process_lock_removes_expired_cache_files(monkeypatch, tmp_path):
+    """Deletes other expired cache files but keeps fresh and unreadable ones."""
+
+    _set_dummy_env(monkeypatch)
+    directory = _process_lock_dir(monkeypatch, tmp_path)
+    directory.mkdir()
+    now = datetime.now(timezone.utc)
+    expired = directory / "brs-refresh-expired.json"
+    expired.write_text(
+        json.dumps({"expiry_time": (now - timedelta(hours=1)).isoformat()}),
+        encoding="utf-8",
+    )
+    fresh = directory / "brs-refresh-fresh.json"
+    fresh.write_text(
+        json.dumps({"expiry_time": (now + timedelta(hours=1)).isoformat()}),
+        encoding="utf-8",
+    )
+    partial = directory / "brs-refresh-partial.json"
+    partial.write_text('{"expiry', encoding="utf-8")
+    lock = directory / "brs-refresh-expired.lock"
+    lock.touch()
+
+    stubber = _stubbed_sts_client(monkeypatch)
+    _add_assume_role_response(stubber, "KEY0000000000001", timedelta(hours=1))
+
+    try:
+        _process_lock_session().refreshable_credentials()
+        assert not expired.exists()
+        assert fresh.exists()
+        assert partial.exists()
+        assert lock.exists()
+        assert len(list(directory.glob("brs-refresh-*.json"))) == 3
+    finally:
+        stubber.deactivate()
+
+
+def test_sts_process_lock_skips_cache_files_locked_elsewhere(
+    monkeypatch, tmp_path
+):
+    """Leaves expired cache files alone while another holder has the lock."""
+
+    _set_dummy_env(monkeypatch)
+    directory = _process_lock_dir(monkeypatch, tmp_path)
+    directory.mkdir()
+    busy = directory / "brs-refresh-busy.json"
+    busy.write_text(
+        json.dumps(
+            {
+                "expiry_time": (
+                    datetime.now(timezone.utc) - timedelta(hours=1)
+                ).isoformat()
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    stubber = _stubbed_sts_client(monkeypatch)
+    _add_assume_role_response(stubber, "KEY0000000000001", timedelta(hours=1))
+
+    try:
+        # flock locks belong to the open file, so a second open in this
+        # process contends with this one just like another process would
+        with sts_module._process_lock(busy.with_suffix(".lock")):
+            _process_lock_session().refreshable_credentials()
+            assert busy.exists()
+
+        stubber.assert_no_pending_responses()
+
+        # once the lock is free, the next sweep removes the expired entry
+        sts_module._remove_expired_cache_files(directory, keep=busy)
+        assert busy.exists()
+        sts_module._remove_expired_cache_files(
+            directory, keep=directory / "brs-refresh-other.json"
+        )
+        assert not busy.exists()
+    finally:
+        stubber.deactivate()
+
+
 @skip_iot
 def test_iot_refreshable_credentials_stubbed(monkeypatch):
     """Returns IoT refreshable credentials via patched getter."""
@@ -546,6 +879,44 @@ def test_custom_refreshes_expired_credentials(monkeypatch):
     assert call_count["count"] >= 2
 
 
+def test_refreshable_credentials_reused_until_refresh(monkeypatch):
+    """Returns the same credentials dict until the credentials refresh."""
+
+    _set_dummy_env(monkeypatch)
+    call_count = {"count": 0}
+
+    def custom_credentials_method():
+        call_count["count"] += 1
+        return {
+            "access_key": f"KEY{call_count['count']:013d}",
+            "secret_key": "secret",
+            "token": "token",
+            "expiry_time": (
+                datetime.now(timezone.utc) + timedelta(hours=1)
+            ).isoformat(),
+        }
+
+    session = RefreshableSession(
+        method="custom",
+        custom_credentials_method=custom_credentials_method,
+        region_name="us-east-1",
+        defer_refresh=True,
+    )
+
+    creds = session.refreshable_credentials()
+    assert session.credentials is creds
+    assert call_count["count"] == 1
+
+    # forcing botocore to refresh on next access
+    session._credentials._expiry_time = datetime.now(timezone.utc) - timedelta(
+        minutes=5
+    )
+
+    refreshed = session.refreshable_credentials()
+    assert refreshed is not creds
+    assert refreshed["access_key"] == "KEY0000000000002"
+
+
 def test_sts_invalid_token_code_raises(monkeypatch):
     """Raises BRSValidationError when MFA TokenCode is invalid."""
 
@@ -565,6 +936,46 @@ def test_sts_invalid_token_code_raises(monkeypatch):
         )
 
 
+@skip_iot
+@pytest.mark.parametrize(
+    "headers, preallocated, in_place",
+    [
+        ([("content-length", "11")], 11, True),
+        ([("Content-Length", "20")], 20, True),
+        ([("content-length", "5")], 5, False),
+        ([("content-length", "nope")], None, False),
+        ([], None, False),
+    ],
+)
+def test_awscrt_response_collects_body(headers, preallocated, in_place):
+    """Preallocates from Content-Length and trims or falls back as needed."""
+
+    response = AWSCRTResponse()  # type: ignore[reportPossiblyUnboundVariable]
+    response.on_response(None, 200, headers)
+
+    if preallocated is None:
+        assert response._view is None
+    else:
+        assert response._view is not None
+        assert len(response._body) == preallocated
+
+    response.on_body(None, b"hello")
+    response.on_body(None, b" world")
+
+    # chunks that fit are written through the view; overflowing the declared
+    # length releases it and falls back to extend
+    assert (response._view is not None) is in_place
+    if in_place:
+        assert response._size == 11
+        assert len(response._body) == preallocated
+
+    assert response.status_code == 200
+    assert response.body == bytearray(b"hello world")
+    assert response._view is None
+    assert len(response._body) == 11
+    assert response.body.decode("utf-8") == "hello world"
+
+
 @skip_iot
 def test_iot_invalid_endpoint_raises(monkeypatch):
     """Rejects invalid IoT credential endpoint format."""